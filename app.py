@@ -1,61 +1,187 @@
+import numpy as np
 import pandas as pd
+from numba import njit
 import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
 from dash import Dash, dcc, html, Input, Output
+from flask_caching import Cache
+from flask_compress import Compress
 import warnings
 import os 
+from concurrent.futures import ThreadPoolExecutor
 
-# Suppress FutureWarning from pandas when accessing columns
-warnings.simplefilter(action='ignore', category=FutureWarning)
+# Serialize figures with orjson; Dash encodes callback responses through plotly.io.json, so this covers them too
+pio.json.config.default_engine = 'orjson'
 
 # --- CONFIGURATION ---
 DATA_URL = 'https://raw.githubusercontent.com/owid/covid-19-data/master/public/data/owid-covid-data.csv'
 LOCAL_FILE = 'dataset/owid-covid-data.csv' 
+LOCAL_PARQUET_FILE = 'dataset/owid-covid-data.parquet'
+
+# Only the columns the dashboard actually reads
+USED_COLS = [
+    'location', 'iso_code', 'date',
+    'new_cases', 'new_deaths', 'total_cases', 'total_deaths',
+    'people_fully_vaccinated', 'people_fully_vaccinated_per_hundred',
+    'total_cases_per_million', 'total_deaths_per_million',
+    'new_tests_smoothed_per_thousand', 'population',
+]
+
+# Metrics selectable on the world map
+MAP_METRIC_OPTIONS = [
+    {'label': 'Total Cases per Million', 'value': 'total_cases_per_million'},
+    {'label': 'People Fully Vaccinated per Hundred', 'value': 'people_fully_vaccinated_per_hundred'},
+    {'label': 'Total Deaths per Million', 'value': 'total_deaths_per_million'}
+]
+MAP_METRIC_VALUES = [opt['value'] for opt in MAP_METRIC_OPTIONS]
+MAP_METRIC_LABEL = {opt['value']: opt['label'] for opt in MAP_METRIC_OPTIONS}
+
+# Time series metric -> (chart title, y-axis label)
+TS_METRIC_MAP = {
+    'new_cases_smoothed': ('New COVID-19 Cases (7-Day Average)', 'Daily Cases'),
+    'new_deaths_smoothed': ('New COVID-19 Deaths (7-Day Average)', 'Daily Deaths')
+}
+
+# Explicit CSV dtypes: absolute counts stay float64 so the key-metric totals display exactly
+CSV_DTYPES = {
+    'location': 'category',
+    'iso_code': 'category',
+    'new_cases': 'float32',
+    'new_deaths': 'float32',
+    'total_cases': 'float64',
+    'total_deaths': 'float64',
+    'people_fully_vaccinated': 'float64',
+    'people_fully_vaccinated_per_hundred': 'float32',
+    'total_cases_per_million': 'float32',
+    'total_deaths_per_million': 'float32',
+    'new_tests_smoothed_per_thousand': 'float32',
+    'population': 'float64',
+}
+
+# Display-only columns that do not need 64-bit precision (smoothed columns are added in load_data)
+FLOAT32_COLS = [
+    'new_cases', 'new_deaths', 'new_cases_smoothed', 'new_deaths_smoothed',
+    'people_fully_vaccinated_per_hundred', 'total_cases_per_million',
+    'total_deaths_per_million', 'new_tests_smoothed_per_thousand',
+]
+
+def read_owid_csv(path):
+    """Reads an OWID CSV, parsing only the used columns with explicit dtypes."""
+    # Suppress FutureWarning from pandas while parsing, without changing the filters process-wide
+    with warnings.catch_warnings():
+        warnings.simplefilter(action='ignore', category=FutureWarning)
+        return pd.read_csv(path, usecols=USED_COLS, dtype=CSV_DTYPES, parse_dates=['date'])
 
 # --- DATA LOADING AND PREPARATION ---
 
+ROLLING_WINDOW = 7
+
+# Eager signature: compiled here at import time, because a lazy compile on a worker thread would
+# deadlock on the import lock still held for this module while load_data() runs
+@njit('void(intp[:], float64[:], float64[:])', cache=True, nogil=True)
+def roll7(codes, x, out):
+    """Trailing 7-day mean over rows sorted by location code and date, written into `out`.
+
+    Matches groupby('location').transform(lambda x: x.rolling(7).mean()): the window
+    resets at every location boundary and any NaN inside the window yields NaN.
+    """
+    buf = np.empty(ROLLING_WINDOW, dtype=np.float64)
+    running = 0.0
+    nan_count = 0
+    cnt = 0
+    prev = -1
+    for i in range(len(x)):
+        if codes[i] != prev:
+            running = 0.0
+            nan_count = 0
+            cnt = 0
+            prev = codes[i]
+
+        # Ring buffer: evict the value leaving the window before adding the new one
+        slot = cnt % ROLLING_WINDOW
+        if cnt >= ROLLING_WINDOW:
+            old = buf[slot]
+            if np.isnan(old):
+                nan_count -= 1
+            else:
+                running -= old
+        v = x[i]
+        buf[slot] = v
+        if np.isnan(v):
+            nan_count += 1
+        else:
+            running += v
+        cnt += 1
+
+        if cnt >= ROLLING_WINDOW and nan_count == 0:
+            out[i] = running / ROLLING_WINDOW
+        else:
+            out[i] = np.nan
+
 def load_data():
     """Attempts to load data from URL, falls back to local file if network fails."""
     df = None
     try:
         print(f"Attempting to download data from: {DATA_URL}")
-        df = pd.read_csv(DATA_URL)
+        # Dtypes are set while parsing, so the Parquet copy loads ready to use
+        df = read_owid_csv(DATA_URL)
         print("Data downloaded successfully.")
         
         # LOGIC: Ensure the 'dataset' directory exists before saving
-        local_dir = os.path.dirname(LOCAL_FILE)
+        local_dir = os.path.dirname(LOCAL_PARQUET_FILE)
         if local_dir:
             # os.makedirs(..., exist_ok=True) creates the directory if it doesn't exist.
             os.makedirs(local_dir, exist_ok=True)
             print(f"Ensured directory exists: {local_dir}") 
         
-        # Save to local file for future offline use
-        df.to_csv(LOCAL_FILE, index=False)
+        # Save to local Parquet file for future offline use (typed and compressed, much faster to reload than CSV)
+        df.to_parquet(LOCAL_PARQUET_FILE, engine='pyarrow', compression='zstd', index=False)
         
     except Exception as e:
-        print(f"Error loading data from URL: {e}. Attempting to load from local file: {LOCAL_FILE}")
+        print(f"Error loading data from URL: {e}. Attempting to load from local file: {LOCAL_PARQUET_FILE}")
         try:
-            # Load from the correct local path
-            df = pd.read_csv(LOCAL_FILE) 
-            print("Data loaded from local file successfully.")
-        except FileNotFoundError:
-            # --- CRITICAL DIAGNOSTIC ADDITION ---
-            abs_path = os.path.abspath(LOCAL_FILE)
-            print("--------------------------------------------------")
-            print("FATAL ERROR: Local data file not found.")
-            print(f"Please ensure the file exists at this EXACT path: {abs_path}")
-            print("--------------------------------------------------")
-            return None
-        except Exception as e_local:
-            print(f"Error loading local data file: {e_local}")
-            return None
+            df = pd.read_parquet(LOCAL_PARQUET_FILE, engine='pyarrow', columns=USED_COLS)
+            print("Data loaded from local Parquet file successfully.")
+        except Exception as e_parquet:
+            print(f"Error loading local Parquet file: {e_parquet}. Attempting to load from local CSV file: {LOCAL_FILE}")
+            try:
+                # Load from the correct local path
+                df = read_owid_csv(LOCAL_FILE)
+                print("Data loaded from local file successfully.")
+            except FileNotFoundError:
+                # --- CRITICAL DIAGNOSTIC ADDITION ---
+                abs_path = os.path.abspath(LOCAL_FILE)
+                print("--------------------------------------------------")
+                print("FATAL ERROR: Local data file not found.")
+                print(f"Please ensure the file exists at this EXACT path: {abs_path}")
+                print("--------------------------------------------------")
+                return None
+            except Exception as e_local:
+                print(f"Error loading local data file: {e_local}")
+                return None
     
     if df is not None:
-        # Standard Data Cleaning and Feature Engineering
-        df['date'] = pd.to_datetime(df['date'])
+        # Standard Data Cleaning and Feature Engineering ('date' is already parsed by read_owid_csv / Parquet).
+        # Make sure the keys are categorical whatever the source was, so sorting, grouping and
+        # comparisons below work on integer codes instead of strings
+        df = df.astype({'location': 'category', 'iso_code': 'category'})
         df = df.sort_values(by=['location', 'date']).reset_index(drop=True)
         # Calculate rolling averages for smoother curves (e.g., 7-day)
-        df['new_cases_smoothed'] = df.groupby('location')['new_cases'].transform(lambda x: x.rolling(7).mean())
-        df['new_deaths_smoothed'] = df.groupby('location')['new_deaths'].transform(lambda x: x.rolling(7).mean())
+        codes = df['location'].cat.codes.to_numpy(dtype=np.intp)
+        cases_smoothed = np.empty(len(df), np.float64)
+        deaths_smoothed = np.empty(len(df), np.float64)
+        # roll7 releases the GIL, so the two independent columns are smoothed concurrently
+        with ThreadPoolExecutor(2) as ex:
+            f_cases = ex.submit(roll7, codes, df['new_cases'].to_numpy(dtype=np.float64), cases_smoothed)
+            f_deaths = ex.submit(roll7, codes, df['new_deaths'].to_numpy(dtype=np.float64), deaths_smoothed)
+            f_cases.result()
+            f_deaths.result()
+        df['new_cases_smoothed'] = cases_smoothed
+        df['new_deaths_smoothed'] = deaths_smoothed
+
+        # Downcast display columns
+        df = df.astype({col: 'float32' for col in FLOAT32_COLS})
         return df
 
 df = load_data()
@@ -65,34 +191,62 @@ if df is None:
     print("Application failed to start due to missing data.")
     exit()
 
-# Pre-calculate unique locations and default country
-locations = df['location'].unique()
-locations.sort()
+# Pre-calculate unique locations and default country ('location' is categorical, so sort via sorted())
+locations = sorted(df['location'].unique())
 DEFAULT_LOCATION = 'United States'
 DEFAULT_COMPARE_LOCATION = 'Canada'
 
+# Pre-split the line chart series per location into plain numpy arrays, so callbacks do a dict lookup
+# instead of scanning all rows or touching pandas
+LINE_COLS = ['new_cases_smoothed', 'new_deaths_smoothed', 'people_fully_vaccinated_per_hundred', 'new_tests_smoothed_per_thousand']
+TS_ARRAYS = {
+    loc: {
+        'date': group['date'].to_numpy(dtype='datetime64[ms]'),
+        **{col: group[col].to_numpy(dtype=np.float32) for col in LINE_COLS},
+    }
+    for loc, group in df.groupby('location', sort=False, observed=True)
+}
+# Last row per location, computed once and shared by the key metrics and the world map.
+# df is already sorted by location and date in load_data, so the last row per location is the latest one.
+is_latest = ~df['location'].duplicated(keep='last')
+
+# Latest key-metric scalars per location
+KEY_METRIC_COLS = ['total_cases', 'total_deaths', 'people_fully_vaccinated', 'population']
+LATEST_BY_LOC = df.loc[is_latest].set_index('location')[KEY_METRIC_COLS].to_dict('index')
+
 # --- DATA FOR WORLD MAP (Requires latest metrics only) ---
 # Filter out non-country data (continents, income groups) using 'iso_code'
 # Note: 'iso_code' is present only for countries in the OWID dataset
-df_latest = df[df['iso_code'].notna()].copy() 
-
-# Get the latest data point for each location (country)
-df_map = df_latest.sort_values('date').groupby('location').tail(1).reset_index(drop=True)
+df_map = df.loc[is_latest & df['iso_code'].notna(), ['iso_code', 'location'] + MAP_METRIC_VALUES].reset_index(drop=True)
 
 
 # --- DASH APP SETUP ---
 app = Dash(__name__, title="COVID-19 Dashboard")
 server = app.server 
 
+# The comparison chart depends only on its dropdown values, so built figures are memoized per input combination
+cache = Cache(server, config={'CACHE_TYPE': 'SimpleCache', 'CACHE_DEFAULT_TIMEOUT': 3600})
+
+# Compress responses (brotli/gzip): figure JSON is large and highly repetitive
+server.config.update(
+    COMPRESS_MIMETYPES=['application/json', 'text/html', 'text/css', 'application/javascript'],
+    COMPRESS_LEVEL=5,
+)
+Compress(server)
+
 # Define common style settings
 CARD_STYLE = 'bg-white p-6 rounded-xl shadow-lg m-4'
 TITLE_STYLE = 'text-3xl font-bold mb-4 text-gray-800'
 HEADER_STYLE = 'text-xl font-semibold mb-2 text-indigo-700'
-MAP_METRIC_OPTIONS = [
-    {'label': 'Total Cases per Million', 'value': 'total_cases_per_million'},
-    {'label': 'People Fully Vaccinated per Hundred', 'value': 'people_fully_vaccinated_per_hundred'},
-    {'label': 'Total Deaths per Million', 'value': 'total_deaths_per_million'}
-]
+# Shared layout for the line charts, applied at Figure construction instead of chained .update_layout calls
+LAYOUT_TEMPLATE = dict(
+    margin={"r": 10, "t": 10, "l": 10, "b": 10},
+    plot_bgcolor='white',
+    paper_bgcolor='white',
+)
+
+# Both country dropdowns share one options list
+LOC_OPTIONS = [{'label': loc, 'value': loc} for loc in locations]
 
 app.layout = html.Div(
     className='min-h-screen bg-gray-100 p-8 font-sans',
@@ -143,7 +297,7 @@ app.layout = html.Div(
                         html.Label("Primary Country/Region:", className=HEADER_STYLE),
                         dcc.Dropdown(
                             id='location-dropdown',
-                            options=[{'label': loc, 'value': loc} for loc in locations],
+                            options=LOC_OPTIONS,
                             value=DEFAULT_LOCATION,
                             className='text-gray-900'
                         )
@@ -156,7 +310,7 @@ app.layout = html.Div(
                         html.Label("Compare With:", className=HEADER_STYLE),
                         dcc.Dropdown(
                             id='compare-dropdown',
-                            options=[{'label': loc, 'value': loc} for loc in locations],
+                            options=LOC_OPTIONS,
                             value=DEFAULT_COMPARE_LOCATION,
                             className='text-gray-900'
                         )
@@ -248,18 +402,75 @@ app.layout = html.Div(
 
 # --- CALLBACKS ---
 
+# Points sent to the browser per line; ~1500 daily points are visually identical at this density
+LTTB_POINTS = 500
+
+@njit(cache=True)
+def lttb_indices(x, y, n_out):
+    """Largest-Triangle-Three-Buckets: indices of the n_out points that best preserve the line's shape."""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    out = np.empty(n_out, dtype=np.int64)
+    out[0] = 0
+    out[n_out - 1] = n - 1
+    every = (n - 2) / (n_out - 2)
+    a = 0
+    for i in range(n_out - 2):
+        # Average of the next bucket is the third triangle vertex
+        next_start = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x = 0.0
+        avg_y = 0.0
+        for j in range(next_start, next_end):
+            avg_x += x[j]
+            avg_y += y[j]
+        avg_x /= next_end - next_start
+        avg_y /= next_end - next_start
+
+        # Keep the point of the current bucket forming the largest triangle with the previous pick
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        max_area = -1.0
+        pick = start
+        for j in range(start, end):
+            area = abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a]))
+            if area > max_area:
+                max_area = area
+                pick = j
+        out[i + 1] = pick
+        a = pick
+    return out
+
+def downsample(x, y, n_out=LTTB_POINTS):
+    """Drops missing values and LTTB-downsamples a date/value series to at most n_out points."""
+    mask = ~np.isnan(y)
+    x, y = x[mask], y[mask]
+    idx = lttb_indices(x.astype('datetime64[ns]').view(np.int64).astype(np.float64), y.astype(np.float64), n_out)
+    return x[idx], y[idx]
+
+def line_trace(x, y, y_label, color, name=None):
+    """Builds a downsampled WebGL line trace with the same hover text Plotly Express would produce."""
+    x, y = downsample(x, y)
+    return go.Scattergl(
+        x=x,
+        y=y,
+        mode='lines',
+        name=name,
+        line=dict(color=color),
+        hovertemplate=f"Date=%{{x}}<br>{y_label}=%{{y}}" + ("" if name else "<extra></extra>"),
+    )
+
 # 1. Update World Map Graph
-@app.callback(
-    Output('world-map-graph', 'figure'),
-    [Input('map-metric-dropdown', 'value')]
-)
-def update_world_map(selected_metric):
+def build_world_map(selected_metric):
+    """Builds the choropleth for a metric as a plain figure dict."""
     # Determine color scale label
-    metric_label = [opt['label'] for opt in MAP_METRIC_OPTIONS if opt['value'] == selected_metric][0]
+    metric_label = MAP_METRIC_LABEL[selected_metric]
 
     # Create the choropleth map
     fig = px.choropleth(
-        df_map, 
+        df_map[['iso_code', 'location', selected_metric]], 
         locations='iso_code', 
         color=selected_metric,
         hover_name='location',
@@ -271,7 +482,17 @@ def update_world_map(selected_metric):
         coloraxis_colorbar=dict(title=metric_label),
     )
     
-    return fig
+    return fig.to_dict()
+
+# The map only depends on the metric, so every option is built once at startup
+MAP_FIGS = {metric: build_world_map(metric) for metric in MAP_METRIC_VALUES}
+
+@app.callback(
+    Output('world-map-graph', 'figure'),
+    [Input('map-metric-dropdown', 'value')]
+)
+def update_world_map(selected_metric):
+    return MAP_FIGS[selected_metric]
 
 
 # 2. Update Time Series Graph (MODIFIED FOR COMPARISON)
@@ -283,39 +504,37 @@ def update_world_map(selected_metric):
      Input('metric-selector', 'value')]
 )
 def update_timeseries_graph(selected_location, compare_location, selected_metric):
-    
-    # Concatenate the data for the two selected countries
-    combined_df = df[df['location'].isin([selected_location, compare_location])]
-    
+    return build_timeseries_graph(selected_location, compare_location, selected_metric)
+
+@cache.memoize()
+def build_timeseries_graph(selected_location, compare_location, selected_metric):
+    """Builds the comparison figure and its title; cached as (figure dict, title)."""
     # Determine titles and labels
-    metric_map = {
-        'new_cases_smoothed': ('New COVID-19 Cases (7-Day Average)', 'Daily Cases'),
-        'new_deaths_smoothed': ('New COVID-19 Deaths (7-Day Average)', 'Daily Deaths')
-    }
-    title, y_label = metric_map.get(selected_metric, ('Data Trend', 'Value'))
+    title, y_label = TS_METRIC_MAP.get(selected_metric, ('Data Trend', 'Value'))
     
-    # Use Plotly Express 'line' to plot multiple lines based on 'location'
-    fig = px.line(
-        combined_df,
-        x='date',
-        y=selected_metric,
-        color='location', # CRITICAL: use 'location' to separate lines
-        title=None, 
-        labels={'date': 'Date', selected_metric: y_label, 'location': 'Country'},
-        color_discrete_sequence=['#4c51bf', '#f59e0b'] # Different colors for comparison
-    ).update_layout(
-        margin={"r": 10, "t": 10, "l": 10, "b": 10},
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        xaxis_title=None,
-        yaxis_tickformat='.2s',
-        legend_title_text='Country'
+    # One WebGL line per selected country, built straight from the per-location arrays (dict.fromkeys drops a duplicate selection)
+    colors = ['#4c51bf', '#f59e0b'] # Different colors for comparison
+    selected = [loc for loc in dict.fromkeys([selected_location, compare_location]) if loc in TS_ARRAYS]
+    traces = [
+        line_trace(TS_ARRAYS[loc]['date'], TS_ARRAYS[loc][selected_metric], y_label, color, name=loc)
+        for loc, color in zip(selected, colors)
+    ]
+    fig = go.Figure(
+        data=traces,
+        layout=go.Layout(
+            LAYOUT_TEMPLATE,
+            yaxis=dict(title=dict(text=y_label), tickformat='.2s'),
+            legend=dict(title=dict(text='Country')),
+        )
     )
     
-    return fig, f"Comparison: {selected_location} vs. {compare_location} ({title})"
+    return fig.to_dict(), f"Comparison: {selected_location} vs. {compare_location} ({title})"
 
 
 # 3. Update Key Metrics and Side Graphs (Existing - Only relies on primary location)
+# Per-location figure dicts keyed by (location, 'vax' | 'test'); ~250 locations, so no eviction is needed
+FIG_CACHE = {}
+
 @app.callback(
     [Output('key-metrics', 'children'),
      Output('vaccination-graph', 'figure'),
@@ -323,16 +542,14 @@ def update_timeseries_graph(selected_location, compare_location, selected_metric
     [Input('location-dropdown', 'value')]
 )
 def update_key_metrics(selected_location):
-    filtered_df = df[df['location'] == selected_location]
-    
     # --- 2.1 Key Metrics ---
-    latest_data = filtered_df.iloc[-1]
+    latest_data = LATEST_BY_LOC[selected_location]
     
-    # Use .get() for safe access in case a column is missing
-    total_cases = latest_data.get('total_cases', 0)
-    total_deaths = latest_data.get('total_deaths', 0)
-    fully_vaccinated = latest_data.get('people_fully_vaccinated', 0)
-    population = latest_data.get('population', 1)
+    # All KEY_METRIC_COLS are guaranteed by USED_COLS, so plain dict access is safe
+    total_cases = latest_data['total_cases']
+    total_deaths = latest_data['total_deaths']
+    fully_vaccinated = latest_data['people_fully_vaccinated']
+    population = latest_data['population']
     
     # Calculate Ratios
     vax_percentage = (fully_vaccinated / population) * 100 if fully_vaccinated else 0
@@ -350,33 +567,38 @@ def update_key_metrics(selected_location):
         html.Div(f"Fully Vax Rate: {vax_percentage:.2f}%", className='text-xl font-bold p-2 bg-yellow-50 border-l-4 border-yellow-500'),
     ]
 
+    # Side graphs never change at runtime: build them on first view of a location, then reuse
+    vax_key, test_key = (selected_location, 'vax'), (selected_location, 'test')
+    if vax_key not in FIG_CACHE:
+        vax_fig, testing_fig = build_side_graphs(selected_location)
+        # Store 'vax' last, since it is the key checked above
+        FIG_CACHE[test_key] = testing_fig
+        FIG_CACHE[vax_key] = vax_fig
+    return metrics_html, FIG_CACHE[vax_key], FIG_CACHE[test_key]
+
+def build_side_graphs(selected_location):
+    """Builds the vaccination and testing figures for a location as figure dicts."""
+    series = TS_ARRAYS[selected_location]
+
     # --- 2.2 Vaccination Graph ---
-    vax_fig = px.line(
-        filtered_df,
-        x='date',
-        y='people_fully_vaccinated_per_hundred',
-        labels={'people_fully_vaccinated_per_hundred': 'Fully Vaccinated (%)', 'date': 'Date'},
-        color_discrete_sequence=['#10b981'] 
-    ).update_layout(
-        margin={"r": 10, "t": 10, "l": 10, "b": 10},
-        plot_bgcolor='white', paper_bgcolor='white', xaxis_title=None
+    vax_fig = go.Figure(
+        data=[line_trace(series['date'], series['people_fully_vaccinated_per_hundred'],
+                         'Fully Vaccinated (%)', '#10b981')],
+        layout=go.Layout(LAYOUT_TEMPLATE, yaxis=dict(title=dict(text='Fully Vaccinated (%)')))
     )
 
     # --- 2.3 Testing Graph ---
-    testing_fig = px.line(
-        filtered_df,
-        x='date',
-        y='new_tests_smoothed_per_thousand',
-        labels={'new_tests_smoothed_per_thousand': 'New Tests (per 1k)', 'date': 'Date'},
-        color_discrete_sequence=['#f97316'] 
-    ).update_layout(
-        margin={"r": 10, "t": 10, "l": 10, "b": 10},
-        plot_bgcolor='white', paper_bgcolor='white', xaxis_title=None
+    testing_fig = go.Figure(
+        data=[line_trace(series['date'], series['new_tests_smoothed_per_thousand'],
+                         'New Tests (per 1k)', '#f97316')],
+        layout=go.Layout(LAYOUT_TEMPLATE, yaxis=dict(title=dict(text='New Tests (per 1k)')))
     )
 
-    return metrics_html, vax_fig, testing_fig
+    return vax_fig.to_dict(), testing_fig.to_dict()
 
 # --- RUN SERVER ---
 
+# Development server only; set DASH_DEBUG=1 for the debugger and hot reload.
+# In production run under gunicorn instead (see Procfile / README): gunicorn app:server -w 4 --threads 4 --preload
 if __name__ == '__main__':
-    app.run(debug=True)
+    app.run(debug=os.environ.get('DASH_DEBUG') == '1')